@@ -119,73 +119,36 @@
         },
         
         /**
-         * Update live preview
-         */
-        updatePreview: function() {
-            const settings = this.getFormData();
-            const css = this.generatePreviewCSS(settings);
-            this.injectPreviewCSS(css);
-        },
-        
-        /**
-         * Get current form data
+         * Live preview rules: one [input selector, CSS template] pair per
+         * styled control (mirrors PHP CSS generation). Form values feed
+         * straight into these templates, so no intermediate settings
+         * object is built on every keystroke.
          */
-        getFormData: function() {
-            const settings = {
-                admin_bar: {},
-                admin_menu: {}
-            };
-            
-            // Admin bar settings
-            settings.admin_bar.bg_color = $('#admin-bar-bg-color').val();
-            settings.admin_bar.text_color = $('#admin-bar-text-color').val();
-            settings.admin_bar.height = $('#admin-bar-height').val();
-            
-            // Admin menu settings
-            settings.admin_menu.bg_color = $('#admin-menu-bg-color').val();
-            settings.admin_menu.text_color = $('#admin-menu-text-color').val();
-            settings.admin_menu.hover_bg_color = $('#admin-menu-hover-bg-color').val();
-            settings.admin_menu.hover_text_color = $('#admin-menu-hover-text-color').val();
-            settings.admin_menu.width = $('#admin-menu-width').val();
-            
-            return settings;
-        },
-        
+        previewRules: [
+            ['#admin-bar-bg-color', 'body.wp-admin #wpadminbar { background-color: {value} !important; }'],
+            ['#admin-bar-text-color', 'body.wp-admin #wpadminbar, body.wp-admin #wpadminbar a, body.wp-admin #wpadminbar .ab-item { color: {value} !important; }'],
+            ['#admin-bar-height', 'body.wp-admin #wpadminbar { height: {value}px !important; }'],
+            ['#admin-menu-bg-color', 'body.wp-admin #adminmenu, body.wp-admin #adminmenu .wp-submenu { background-color: {value} !important; }'],
+            ['#admin-menu-text-color', 'body.wp-admin #adminmenu a, body.wp-admin #adminmenu .wp-submenu a { color: {value} !important; }'],
+            ['#admin-menu-hover-bg-color', 'body.wp-admin #adminmenu a:hover, body.wp-admin #adminmenu .wp-submenu a:hover { background-color: {value} !important; }'],
+            ['#admin-menu-hover-text-color', 'body.wp-admin #adminmenu a:hover, body.wp-admin #adminmenu .wp-submenu a:hover { color: {value} !important; }'],
+            ['#admin-menu-width', 'body.wp-admin #adminmenu { width: {value}px !important; }']
+        ],
+
         /**
-         * Generate preview CSS (mirrors PHP CSS generation)
+         * Update live preview
          */
-        generatePreviewCSS: function(settings) {
-            let css = '';
-            
-            // Admin bar CSS
-            if (settings.admin_bar.bg_color) {
-                css += `body.wp-admin #wpadminbar { background-color: ${settings.admin_bar.bg_color} !important; }`;
-            }
-            if (settings.admin_bar.text_color) {
-                css += `body.wp-admin #wpadminbar, body.wp-admin #wpadminbar a, body.wp-admin #wpadminbar .ab-item { color: ${settings.admin_bar.text_color} !important; }`;
-            }
-            if (settings.admin_bar.height) {
-                css += `body.wp-admin #wpadminbar { height: ${settings.admin_bar.height}px !important; }`;
-            }
-            
-            // Admin menu CSS
-            if (settings.admin_menu.bg_color) {
-                css += `body.wp-admin #adminmenu, body.wp-admin #adminmenu .wp-submenu { background-color: ${settings.admin_menu.bg_color} !important; }`;
-            }
-            if (settings.admin_menu.text_color) {
-                css += `body.wp-admin #adminmenu a, body.wp-admin #adminmenu .wp-submenu a { color: ${settings.admin_menu.text_color} !important; }`;
-            }
-            if (settings.admin_menu.hover_bg_color) {
-                css += `body.wp-admin #adminmenu a:hover, body.wp-admin #adminmenu .wp-submenu a:hover { background-color: ${settings.admin_menu.hover_bg_color} !important; }`;
-            }
-            if (settings.admin_menu.hover_text_color) {
-                css += `body.wp-admin #adminmenu a:hover, body.wp-admin #adminmenu .wp-submenu a:hover { color: ${settings.admin_menu.hover_text_color} !important; }`;
-            }
-            if (settings.admin_menu.width) {
-                css += `body.wp-admin #adminmenu { width: ${settings.admin_menu.width}px !important; }`;
-            }
-            
-            return css;
+        updatePreview: function() {
+            const rules = [];
+
+            this.previewRules.forEach(function(rule) {
+                const value = $(rule[0]).val();
+                if (value) {
+                    rules.push(rule[1].replace('{value}', value));
+                }
+            });
+
+            this.injectPreviewCSS(rules.join(''));
         },
         
         /**
@@ -21,6 +21,194 @@ if ( ! defined( 'ABSPATH' ) ) {
  */
 class MASE_CSS_Generator {
 
+	/**
+	 * Base shadow sizes by intensity.
+	 *
+	 * Hoisted to a class constant so the lookup table is built once
+	 * instead of being re-allocated on every shadow calculation.
+	 *
+	 * @var array
+	 */
+	const SHADOW_SIZES = array(
+		'subtle' => array( 'x' => 2, 'y' => 2, 'spread' => 0 ),
+		'medium' => array( 'x' => 4, 'y' => 4, 'spread' => 0 ),
+		'strong' => array( 'x' => 8, 'y' => 8, 'spread' => 2 ),
+	);
+
+	/**
+	 * Shadow direction modifiers.
+	 *
+	 * @var array
+	 */
+	const SHADOW_DIRECTIONS = array(
+		'top'    => array( 'x' => 0, 'y' => -1 ),
+		'right'  => array( 'x' => 1, 'y' => 0 ),
+		'bottom' => array( 'x' => 0, 'y' => 1 ),
+		'left'   => array( 'x' => -1, 'y' => 0 ),
+		'center' => array( 'x' => 0, 'y' => 0 ),
+	);
+
+	/**
+	 * Shadow intensity escalation for hover states.
+	 *
+	 * @var array
+	 */
+	const HOVER_INTENSITY_MAP = array(
+		'subtle' => 'medium',
+		'medium' => 'strong',
+		'strong' => 'strong',
+	);
+
+	/**
+	 * Typography sections mapped to their target selectors.
+	 *
+	 * The section structure is fixed at author time, so the renderer can
+	 * iterate this table instead of re-interpreting the nested settings
+	 * layout with a separate hand-written block per section.
+	 *
+	 * @var array
+	 */
+	const TYPOGRAPHY_SECTIONS = array(
+		'admin_bar'  => 'body.wp-admin #wpadminbar,body.wp-admin #wpadminbar .ab-item,body.wp-admin #wpadminbar > #wp-toolbar span.ab-label,body.wp-admin #wpadminbar > #wp-toolbar span.noticon',
+		'admin_menu' => 'body.wp-admin #adminmenu a,body.wp-admin #adminmenu div.wp-menu-name,body.wp-admin #adminmenu .wp-submenu a',
+		'content'    => 'body.wp-admin #wpbody-content,body.wp-admin .wrap,body.wp-admin #wpbody-content p,body.wp-admin .wrap p',
+	);
+
+	/**
+	 * Admin bar CSS template.
+	 *
+	 * Pre-compiled with sprintf placeholders so each generation pass is a
+	 * single format call instead of a run of string concatenations.
+	 * Holes: %1$s background color, %2$d height, %3$s text color.
+	 *
+	 * @var string
+	 */
+	const ADMIN_BAR_CSS_TEMPLATE =
+		'body.wp-admin #wpadminbar {background-color: %1$s !important;height: %2$dpx !important;}' .
+		'body.wp-admin #wpadminbar .ab-item,body.wp-admin #wpadminbar a.ab-item,body.wp-admin #wpadminbar > #wp-toolbar span.ab-label,body.wp-admin #wpadminbar > #wp-toolbar span.noticon {color: %3$s !important;}' .
+		'body.wp-admin.admin-bar {margin-top: %2$dpx !important;}' .
+		'body.wp-admin #wpadminbar .ab-sub-wrapper {top: %2$dpx !important;}';
+
+	/**
+	 * Admin menu CSS template.
+	 *
+	 * Holes: %1$s background color, %2$s text color, %3$s hover background
+	 * color, %4$s hover text color, %5$d width.
+	 *
+	 * @var string
+	 */
+	const ADMIN_MENU_CSS_TEMPLATE =
+		'body.wp-admin #adminmenu,body.wp-admin #adminmenuback,body.wp-admin #adminmenuwrap {background-color: %1$s !important;width: %5$dpx !important;}' .
+		'body.wp-admin #adminmenu a,body.wp-admin #adminmenu div.wp-menu-name {color: %2$s !important;}' .
+		'body.wp-admin #adminmenu li.menu-top:hover,body.wp-admin #adminmenu li.opensub > a.menu-top,body.wp-admin #adminmenu li > a.menu-top:focus {background-color: %3$s !important;}' .
+		'body.wp-admin #adminmenu li.menu-top:hover a,body.wp-admin #adminmenu li.opensub > a.menu-top,body.wp-admin #adminmenu li > a.menu-top:focus {color: %4$s !important;}' .
+		'body.wp-admin #wpcontent,body.wp-admin #wpfooter {margin-left: %5$dpx !important;}' .
+		'body.wp-admin.folded #wpcontent,body.wp-admin.folded #wpfooter {margin-left: 36px !important;}';
+
+	/**
+	 * Static :root custom properties for the shadow system.
+	 *
+	 * No setting-dependent holes, so the block is assembled once at
+	 * compile time rather than re-concatenated on every generation pass.
+	 *
+	 * @var string
+	 */
+	const SHADOW_ROOT_CSS =
+		':root{' .
+		'--mase-shadow-subtle:0 2px 8px rgba(0,0,0,0.1);' .
+		'--mase-shadow-medium:0 4px 12px rgba(0,0,0,0.15);' .
+		'--mase-shadow-strong:0 8px 20px 2px rgba(0,0,0,0.2);' .
+		'--mase-transition-shadow:box-shadow 200ms cubic-bezier(0.4,0,0.2,1);' .
+		'}';
+
+	/**
+	 * Static accessibility CSS: reduced motion support, focus indicators,
+	 * error-state contrast and keyboard navigation feedback
+	 * (Requirements 18.1-18.4, 13.1).
+	 *
+	 * @var string
+	 */
+	const ACCESSIBILITY_CSS =
+		'@media (prefers-reduced-motion:reduce){' .
+		'body.wp-admin *{' .
+		'transition:none!important;' .
+		'}' .
+		'}' .
+		'body.wp-admin .mase-range:focus,' .
+		'body.wp-admin .mase-select:focus,' .
+		'body.wp-admin .mase-color-picker:focus,' .
+		'body.wp-admin input[type="radio"]:focus{' .
+		'outline:2px solid #2271b1!important;' .
+		'outline-offset:2px!important;' .
+		'box-shadow:0 0 0 1px #fff,0 0 0 3px #2271b1!important;' .
+		'}' .
+		'body.wp-admin .mase-shadow-direction label:focus-within{' .
+		'outline:2px solid #2271b1!important;' .
+		'outline-offset:2px!important;' .
+		'border-radius:3px!important;' .
+		'}' .
+		'body.wp-admin .mase-input.error,' .
+		'body.wp-admin .mase-input[aria-invalid="true"]{' .
+		'border-color:#d63638!important;' .
+		'box-shadow:0 0 0 1px #d63638!important;' .
+		'}' .
+		'body.wp-admin .palette-preset:focus,' .
+		'body.wp-admin #mase-export-btn:focus,' .
+		'body.wp-admin #mase-import-btn:focus{' .
+		'outline:2px solid #2271b1!important;' .
+		'outline-offset:2px!important;' .
+		'box-shadow:0 0 0 1px #fff,0 0 0 3px #2271b1!important;' .
+		'}';
+
+	/**
+	 * Static browser fallbacks for spacing CSS: flexbox, box-sizing and
+	 * vendor-prefixed transition support for older browsers (Task 11.5).
+	 *
+	 * @var string
+	 */
+	const SPACING_FALLBACKS_BASE_CSS =
+		'/* Browser fallbacks for IE11 and older browsers */' .
+		'body.wp-admin #adminmenu{' .
+		'display:block;' .
+		'display:-webkit-box;' .
+		'display:-ms-flexbox;' .
+		'display:flex;' .
+		'}' .
+		'body.wp-admin #adminmenu li.menu-top > a,' .
+		'body.wp-admin #wpadminbar .ab-item,' .
+		'body.wp-admin #adminmenu .wp-submenu a{' .
+		'-webkit-box-sizing:border-box;' .
+		'-moz-box-sizing:border-box;' .
+		'box-sizing:border-box;' .
+		'}' .
+		'body.wp-admin #adminmenu li.menu-top > a,' .
+		'body.wp-admin #adminmenu li.menu-top,' .
+		'body.wp-admin #wpadminbar .ab-item{' .
+		'-webkit-transition:padding 0.3s ease,margin 0.3s ease;' .
+		'-moz-transition:padding 0.3s ease,margin 0.3s ease;' .
+		'-o-transition:padding 0.3s ease,margin 0.3s ease;' .
+		'transition:padding 0.3s ease,margin 0.3s ease;' .
+		'}';
+
+	/**
+	 * Static IE10+/Edge Legacy specific spacing fixes (Task 11.5).
+	 *
+	 * @var string
+	 */
+	const SPACING_FALLBACKS_IE_CSS =
+		'@media screen and (-ms-high-contrast:active),(-ms-high-contrast:none){' .
+		'/* IE10+ specific styles */' .
+		'body.wp-admin #adminmenu li.menu-top > a{' .
+		'display:block;' .
+		'}' .
+		'}' .
+		'@supports (-ms-ime-align:auto){' .
+		'/* Edge Legacy specific styles */' .
+		'body.wp-admin #adminmenu li.menu-top > a{' .
+		'display:block;' .
+		'}' .
+		'}';
+
 	/**
 	 * Generate CSS from settings.
 	 *
@@ -89,33 +277,8 @@ class MASE_CSS_Generator {
 			$text_color = isset( $admin_bar['text_color'] ) ? $admin_bar['text_color'] : '#ffffff';
 			$height     = isset( $admin_bar['height'] ) ? absint( $admin_bar['height'] ) : 32;
 
-			$css = '';
-
-			// Admin bar background and height.
-			$css .= 'body.wp-admin #wpadminbar {';
-			$css .= 'background-color: ' . $bg_color . ' !important;';
-			$css .= 'height: ' . $height . 'px !important;';
-			$css .= '}';
-
-			// Admin bar text color.
-			$css .= 'body.wp-admin #wpadminbar .ab-item,';
-			$css .= 'body.wp-admin #wpadminbar a.ab-item,';
-			$css .= 'body.wp-admin #wpadminbar > #wp-toolbar span.ab-label,';
-			$css .= 'body.wp-admin #wpadminbar > #wp-toolbar span.noticon {';
-			$css .= 'color: ' . $text_color . ' !important;';
-			$css .= '}';
-
-			// Adjust page margin for admin bar height.
-			$css .= 'body.wp-admin.admin-bar {';
-			$css .= 'margin-top: ' . $height . 'px !important;';
-			$css .= '}';
-
-			// Adjust admin bar submenu position.
-			$css .= 'body.wp-admin #wpadminbar .ab-sub-wrapper {';
-			$css .= 'top: ' . $height . 'px !important;';
-			$css .= '}';
-
-			return $css;
+			// One format pass over the pre-compiled template.
+			return sprintf( self::ADMIN_BAR_CSS_TEMPLATE, $bg_color, $height, $text_color );
 
 		} catch ( Exception $e ) {
 			error_log( sprintf( 'MASE: Admin bar CSS generation failed: %s', $e->getMessage() ) );
@@ -139,48 +302,15 @@ class MASE_CSS_Generator {
 			$hover_text_color = isset( $admin_menu['hover_text_color'] ) ? $admin_menu['hover_text_color'] : '#00b9eb';
 			$width            = isset( $admin_menu['width'] ) ? absint( $admin_menu['width'] ) : 160;
 
-			$css = '';
-
-			// Admin menu background and width.
-			$css .= 'body.wp-admin #adminmenu,';
-			$css .= 'body.wp-admin #adminmenuback,';
-			$css .= 'body.wp-admin #adminmenuwrap {';
-			$css .= 'background-color: ' . $bg_color . ' !important;';
-			$css .= 'width: ' . $width . 'px !important;';
-			$css .= '}';
-
-			// Admin menu text color.
-			$css .= 'body.wp-admin #adminmenu a,';
-			$css .= 'body.wp-admin #adminmenu div.wp-menu-name {';
-			$css .= 'color: ' . $text_color . ' !important;';
-			$css .= '}';
-
-			// Admin menu hover states.
-			$css .= 'body.wp-admin #adminmenu li.menu-top:hover,';
-			$css .= 'body.wp-admin #adminmenu li.opensub > a.menu-top,';
-			$css .= 'body.wp-admin #adminmenu li > a.menu-top:focus {';
-			$css .= 'background-color: ' . $hover_bg_color . ' !important;';
-			$css .= '}';
-
-			$css .= 'body.wp-admin #adminmenu li.menu-top:hover a,';
-			$css .= 'body.wp-admin #adminmenu li.opensub > a.menu-top,';
-			$css .= 'body.wp-admin #adminmenu li > a.menu-top:focus {';
-			$css .= 'color: ' . $hover_text_color . ' !important;';
-			$css .= '}';
-
-			// Adjust content area margin for menu width.
-			$css .= 'body.wp-admin #wpcontent,';
-			$css .= 'body.wp-admin #wpfooter {';
-			$css .= 'margin-left: ' . $width . 'px !important;';
-			$css .= '}';
-
-			// Adjust for folded menu.
-			$css .= 'body.wp-admin.folded #wpcontent,';
-			$css .= 'body.wp-admin.folded #wpfooter {';
-			$css .= 'margin-left: 36px !important;';
-			$css .= '}';
-
-			return $css;
+			// One format pass over the pre-compiled template.
+			return sprintf(
+				self::ADMIN_MENU_CSS_TEMPLATE,
+				$bg_color,
+				$text_color,
+				$hover_bg_color,
+				$hover_text_color,
+				$width
+			);
 
 		} catch ( Exception $e ) {
 			error_log( sprintf( 'MASE: Admin menu CSS generation failed: %s', $e->getMessage() ) );
@@ -219,87 +349,11 @@ class MASE_CSS_Generator {
 
 			$css = '';
 
-			// Generate admin bar typography CSS.
-			if ( isset( $typography['admin_bar'] ) ) {
-				$admin_bar = $typography['admin_bar'];
-
-				$css .= 'body.wp-admin #wpadminbar,';
-				$css .= 'body.wp-admin #wpadminbar .ab-item,';
-				$css .= 'body.wp-admin #wpadminbar > #wp-toolbar span.ab-label,';
-				$css .= 'body.wp-admin #wpadminbar > #wp-toolbar span.noticon {';
-
-				if ( isset( $admin_bar['font_size'] ) ) {
-					$css .= 'font-size: ' . absint( $admin_bar['font_size'] ) . 'px !important;';
-				}
-				if ( isset( $admin_bar['font_weight'] ) ) {
-					$css .= 'font-weight: ' . absint( $admin_bar['font_weight'] ) . ' !important;';
-				}
-				if ( isset( $admin_bar['line_height'] ) ) {
-					$css .= 'line-height: ' . floatval( $admin_bar['line_height'] ) . ' !important;';
-				}
-				if ( isset( $admin_bar['letter_spacing'] ) ) {
-					$css .= 'letter-spacing: ' . intval( $admin_bar['letter_spacing'] ) . 'px !important;';
-				}
-				if ( isset( $admin_bar['text_transform'] ) ) {
-					$css .= 'text-transform: ' . esc_attr( $admin_bar['text_transform'] ) . ' !important;';
-				}
-
-				$css .= '}';
-			}
-
-			// Generate admin menu typography CSS.
-			if ( isset( $typography['admin_menu'] ) ) {
-				$admin_menu = $typography['admin_menu'];
-
-				$css .= 'body.wp-admin #adminmenu a,';
-				$css .= 'body.wp-admin #adminmenu div.wp-menu-name,';
-				$css .= 'body.wp-admin #adminmenu .wp-submenu a {';
-
-				if ( isset( $admin_menu['font_size'] ) ) {
-					$css .= 'font-size: ' . absint( $admin_menu['font_size'] ) . 'px !important;';
-				}
-				if ( isset( $admin_menu['font_weight'] ) ) {
-					$css .= 'font-weight: ' . absint( $admin_menu['font_weight'] ) . ' !important;';
-				}
-				if ( isset( $admin_menu['line_height'] ) ) {
-					$css .= 'line-height: ' . floatval( $admin_menu['line_height'] ) . ' !important;';
-				}
-				if ( isset( $admin_menu['letter_spacing'] ) ) {
-					$css .= 'letter-spacing: ' . intval( $admin_menu['letter_spacing'] ) . 'px !important;';
+			// Render each configured section from the constant section table.
+			foreach ( self::TYPOGRAPHY_SECTIONS as $section => $selector ) {
+				if ( isset( $typography[ $section ] ) ) {
+					$css .= $this->generate_typography_rules( $selector, $typography[ $section ] );
 				}
-				if ( isset( $admin_menu['text_transform'] ) ) {
-					$css .= 'text-transform: ' . esc_attr( $admin_menu['text_transform'] ) . ' !important;';
-				}
-
-				$css .= '}';
-			}
-
-			// Generate content typography CSS.
-			if ( isset( $typography['content'] ) ) {
-				$content = $typography['content'];
-
-				$css .= 'body.wp-admin #wpbody-content,';
-				$css .= 'body.wp-admin .wrap,';
-				$css .= 'body.wp-admin #wpbody-content p,';
-				$css .= 'body.wp-admin .wrap p {';
-
-				if ( isset( $content['font_size'] ) ) {
-					$css .= 'font-size: ' . absint( $content['font_size'] ) . 'px !important;';
-				}
-				if ( isset( $content['font_weight'] ) ) {
-					$css .= 'font-weight: ' . absint( $content['font_weight'] ) . ' !important;';
-				}
-				if ( isset( $content['line_height'] ) ) {
-					$css .= 'line-height: ' . floatval( $content['line_height'] ) . ' !important;';
-				}
-				if ( isset( $content['letter_spacing'] ) ) {
-					$css .= 'letter-spacing: ' . intval( $content['letter_spacing'] ) . 'px !important;';
-				}
-				if ( isset( $content['text_transform'] ) ) {
-					$css .= 'text-transform: ' . esc_attr( $content['text_transform'] ) . ' !important;';
-				}
-
-				$css .= '}';
 			}
 
 			// Performance monitoring.
@@ -333,6 +387,37 @@ class MASE_CSS_Generator {
 		}
 	}
 
+	/**
+	 * Generate a typography rule block for a single section.
+	 *
+	 * @param string $selector Comma-separated selector list for the section.
+	 * @param array  $section  Typography settings for the section.
+	 * @return string Typography rule block CSS.
+	 */
+	private function generate_typography_rules( $selector, $section ) {
+		$css = $selector . ' {';
+
+		if ( isset( $section['font_size'] ) ) {
+			$css .= 'font-size: ' . absint( $section['font_size'] ) . 'px !important;';
+		}
+		if ( isset( $section['font_weight'] ) ) {
+			$css .= 'font-weight: ' . absint( $section['font_weight'] ) . ' !important;';
+		}
+		if ( isset( $section['line_height'] ) ) {
+			$css .= 'line-height: ' . floatval( $section['line_height'] ) . ' !important;';
+		}
+		if ( isset( $section['letter_spacing'] ) ) {
+			$css .= 'letter-spacing: ' . intval( $section['letter_spacing'] ) . 'px !important;';
+		}
+		if ( isset( $section['text_transform'] ) ) {
+			$css .= 'text-transform: ' . esc_attr( $section['text_transform'] ) . ' !important;';
+		}
+
+		$css .= '}';
+
+		return $css;
+	}
+
 	/**
 	 * Generate visual effects CSS.
 	 *
@@ -362,15 +447,8 @@ class MASE_CSS_Generator {
 				return '';
 			}
 
-			$css = '';
-
 			// CSS Custom Properties for shadow system.
-			$css .= ':root{';
-			$css .= '--mase-shadow-subtle:0 2px 8px rgba(0,0,0,0.1);';
-			$css .= '--mase-shadow-medium:0 4px 12px rgba(0,0,0,0.15);';
-			$css .= '--mase-shadow-strong:0 8px 20px 2px rgba(0,0,0,0.2);';
-			$css .= '--mase-transition-shadow:box-shadow 200ms cubic-bezier(0.4,0,0.2,1);';
-			$css .= '}';
+			$css = self::SHADOW_ROOT_CSS;
 
 			// Generate admin bar visual effects.
 			if ( isset( $visual_effects['admin_bar'] ) ) {
@@ -416,14 +494,16 @@ class MASE_CSS_Generator {
 			
 			if ( $disable_mobile_shadows ) {
 				// Disable shadows completely on mobile but maintain border radius (Requirement 16.3).
-				$css .= 'body.wp-admin #wpadminbar,';
-				$css .= 'body.wp-admin #adminmenu a,';
-				$css .= 'body.wp-admin .button,';
-				$css .= 'body.wp-admin .button-primary,';
-				$css .= 'body.wp-admin input[type="text"],';
-				$css .= 'body.wp-admin input[type="email"],';
-				$css .= 'body.wp-admin textarea,';
-				$css .= 'body.wp-admin select{';
+				$css .= $this->admin_selectors( array(
+					'#wpadminbar',
+					'#adminmenu a',
+					'.button',
+					'.button-primary',
+					'input[type="text"]',
+					'input[type="email"]',
+					'textarea',
+					'select',
+				) ) . '{';
 				$css .= 'box-shadow:none!important;';
 				$css .= '}';
 			} else {
@@ -444,18 +524,14 @@ class MASE_CSS_Generator {
 				
 				if ( isset( $visual_effects['buttons'] ) ) {
 					$mobile_shadow = $this->calculate_mobile_shadow( $visual_effects['buttons'] );
-					$css .= 'body.wp-admin .button,';
-					$css .= 'body.wp-admin .button-primary{';
+					$css .= $this->admin_selectors( array( '.button', '.button-primary' ) ) . '{';
 					$css .= 'box-shadow:' . $mobile_shadow . '!important;';
 					$css .= '}';
 				}
-				
+
 				if ( isset( $visual_effects['form_fields'] ) ) {
 					$mobile_shadow = $this->calculate_mobile_shadow( $visual_effects['form_fields'] );
-					$css .= 'body.wp-admin input[type="text"],';
-					$css .= 'body.wp-admin input[type="email"],';
-					$css .= 'body.wp-admin textarea,';
-					$css .= 'body.wp-admin select{';
+					$css .= $this->admin_selectors( array( 'input[type="text"]', 'input[type="email"]', 'textarea', 'select' ) ) . '{';
 					$css .= 'box-shadow:' . $mobile_shadow . '!important;';
 					$css .= '}';
 				}
@@ -463,45 +539,9 @@ class MASE_CSS_Generator {
 			
 			$css .= '}';
 
-			// Reduced motion support (Requirement 18.4).
-			$css .= '@media (prefers-reduced-motion:reduce){';
-			$css .= 'body.wp-admin *{';
-			$css .= 'transition:none!important;';
-			$css .= '}';
-			$css .= '}';
-
-			// Focus indicators with sufficient contrast (Requirement 18.2, 13.1).
-			$css .= 'body.wp-admin .mase-range:focus,';
-			$css .= 'body.wp-admin .mase-select:focus,';
-			$css .= 'body.wp-admin .mase-color-picker:focus,';
-			$css .= 'body.wp-admin input[type="radio"]:focus{';
-			$css .= 'outline:2px solid #2271b1!important;';
-			$css .= 'outline-offset:2px!important;';
-			$css .= 'box-shadow:0 0 0 1px #fff,0 0 0 3px #2271b1!important;';
-			$css .= '}';
-
-			// High contrast focus for better visibility (Requirement 18.1, 18.2).
-			$css .= 'body.wp-admin .mase-shadow-direction label:focus-within{';
-			$css .= 'outline:2px solid #2271b1!important;';
-			$css .= 'outline-offset:2px!important;';
-			$css .= 'border-radius:3px!important;';
-			$css .= '}';
-
-			// Ensure sufficient contrast for error states (Requirement 18.1).
-			$css .= 'body.wp-admin .mase-input.error,';
-			$css .= 'body.wp-admin .mase-input[aria-invalid="true"]{';
-			$css .= 'border-color:#d63638!important;';
-			$css .= 'box-shadow:0 0 0 1px #d63638!important;';
-			$css .= '}';
-
-			// Keyboard navigation visual feedback (Requirement 18.3).
-			$css .= 'body.wp-admin .palette-preset:focus,';
-			$css .= 'body.wp-admin #mase-export-btn:focus,';
-			$css .= 'body.wp-admin #mase-import-btn:focus{';
-			$css .= 'outline:2px solid #2271b1!important;';
-			$css .= 'outline-offset:2px!important;';
-			$css .= 'box-shadow:0 0 0 1px #fff,0 0 0 3px #2271b1!important;';
-			$css .= '}';
+			// Static accessibility CSS: reduced motion, focus indicators,
+			// error-state contrast (Requirements 18.1-18.4, 13.1).
+			$css .= self::ACCESSIBILITY_CSS;
 
 			// Performance monitoring.
 			$duration = ( microtime( true ) - $start_time ) * 1000; // Convert to milliseconds.
@@ -563,15 +603,8 @@ class MASE_CSS_Generator {
 		if ( $include_hover && 'none' !== $shadow ) {
 			$hover_effects = $effects;
 			// Increase shadow intensity for hover state.
-			if ( isset( $hover_effects['shadow_intensity'] ) ) {
-				$intensity_map = array(
-					'subtle' => 'medium',
-					'medium' => 'strong',
-					'strong' => 'strong',
-				);
-				if ( isset( $intensity_map[ $hover_effects['shadow_intensity'] ] ) ) {
-					$hover_effects['shadow_intensity'] = $intensity_map[ $hover_effects['shadow_intensity'] ];
-				}
+			if ( isset( $hover_effects['shadow_intensity'] ) && isset( self::HOVER_INTENSITY_MAP[ $hover_effects['shadow_intensity'] ] ) ) {
+				$hover_effects['shadow_intensity'] = self::HOVER_INTENSITY_MAP[ $hover_effects['shadow_intensity'] ];
 			}
 
 			$hover_shadow = $this->calculate_shadow( $hover_effects );
@@ -650,25 +683,9 @@ class MASE_CSS_Generator {
 			return 'none';
 		}
 
-		// Base shadow sizes by intensity.
-		$sizes = array(
-			'subtle' => array( 'x' => 2, 'y' => 2, 'spread' => 0 ),
-			'medium' => array( 'x' => 4, 'y' => 4, 'spread' => 0 ),
-			'strong' => array( 'x' => 8, 'y' => 8, 'spread' => 2 ),
-		);
-
-		// Direction modifiers.
-		$directions = array(
-			'top'    => array( 'x' => 0, 'y' => -1 ),
-			'right'  => array( 'x' => 1, 'y' => 0 ),
-			'bottom' => array( 'x' => 0, 'y' => 1 ),
-			'left'   => array( 'x' => -1, 'y' => 0 ),
-			'center' => array( 'x' => 0, 'y' => 0 ),
-		);
-
-		// Get base size and direction modifier.
-		$base = isset( $sizes[ $intensity ] ) ? $sizes[ $intensity ] : $sizes['subtle'];
-		$dir  = isset( $directions[ $direction ] ) ? $directions[ $direction ] : $directions['bottom'];
+		// Get base size and direction modifier from the constant lookup tables.
+		$base = isset( self::SHADOW_SIZES[ $intensity ] ) ? self::SHADOW_SIZES[ $intensity ] : self::SHADOW_SIZES['subtle'];
+		$dir  = isset( self::SHADOW_DIRECTIONS[ $direction ] ) ? self::SHADOW_DIRECTIONS[ $direction ] : self::SHADOW_DIRECTIONS['bottom'];
 
 		// Calculate final shadow values.
 		$x      = $base['x'] * $dir['x'];
@@ -716,70 +733,22 @@ class MASE_CSS_Generator {
 
 			// Generate menu padding CSS.
 			if ( isset( $spacing['menu_padding'] ) && is_array( $spacing['menu_padding'] ) ) {
-				$menu_padding = $spacing['menu_padding'];
-				$unit = isset( $menu_padding['unit'] ) ? $menu_padding['unit'] : 'px';
-
 				$css .= 'body.wp-admin #adminmenu li.menu-top > a{';
-				
-				if ( isset( $menu_padding['top'] ) ) {
-					$css .= 'padding-top:' . $this->format_spacing_value( $menu_padding['top'], $unit ) . '!important;';
-				}
-				if ( isset( $menu_padding['right'] ) ) {
-					$css .= 'padding-right:' . $this->format_spacing_value( $menu_padding['right'], $unit ) . '!important;';
-				}
-				if ( isset( $menu_padding['bottom'] ) ) {
-					$css .= 'padding-bottom:' . $this->format_spacing_value( $menu_padding['bottom'], $unit ) . '!important;';
-				}
-				if ( isset( $menu_padding['left'] ) ) {
-					$css .= 'padding-left:' . $this->format_spacing_value( $menu_padding['left'], $unit ) . '!important;';
-				}
-				
+				$css .= $this->box_sides_css( $spacing['menu_padding'], 'padding' );
 				$css .= '}';
 			}
 
 			// Generate menu margin CSS.
 			if ( isset( $spacing['menu_margin'] ) && is_array( $spacing['menu_margin'] ) ) {
-				$menu_margin = $spacing['menu_margin'];
-				$unit = isset( $menu_margin['unit'] ) ? $menu_margin['unit'] : 'px';
-
 				$css .= 'body.wp-admin #adminmenu li.menu-top{';
-				
-				if ( isset( $menu_margin['top'] ) ) {
-					$css .= 'margin-top:' . $this->format_spacing_value( $menu_margin['top'], $unit ) . '!important;';
-				}
-				if ( isset( $menu_margin['right'] ) ) {
-					$css .= 'margin-right:' . $this->format_spacing_value( $menu_margin['right'], $unit ) . '!important;';
-				}
-				if ( isset( $menu_margin['bottom'] ) ) {
-					$css .= 'margin-bottom:' . $this->format_spacing_value( $menu_margin['bottom'], $unit ) . '!important;';
-				}
-				if ( isset( $menu_margin['left'] ) ) {
-					$css .= 'margin-left:' . $this->format_spacing_value( $menu_margin['left'], $unit ) . '!important;';
-				}
-				
+				$css .= $this->box_sides_css( $spacing['menu_margin'], 'margin' );
 				$css .= '}';
 			}
 
 			// Generate admin bar padding CSS.
 			if ( isset( $spacing['admin_bar_padding'] ) && is_array( $spacing['admin_bar_padding'] ) ) {
-				$admin_bar_padding = $spacing['admin_bar_padding'];
-				$unit = isset( $admin_bar_padding['unit'] ) ? $admin_bar_padding['unit'] : 'px';
-
 				$css .= 'body.wp-admin #wpadminbar .ab-item{';
-				
-				if ( isset( $admin_bar_padding['top'] ) ) {
-					$css .= 'padding-top:' . $this->format_spacing_value( $admin_bar_padding['top'], $unit ) . '!important;';
-				}
-				if ( isset( $admin_bar_padding['right'] ) ) {
-					$css .= 'padding-right:' . $this->format_spacing_value( $admin_bar_padding['right'], $unit ) . '!important;';
-				}
-				if ( isset( $admin_bar_padding['bottom'] ) ) {
-					$css .= 'padding-bottom:' . $this->format_spacing_value( $admin_bar_padding['bottom'], $unit ) . '!important;';
-				}
-				if ( isset( $admin_bar_padding['left'] ) ) {
-					$css .= 'padding-left:' . $this->format_spacing_value( $admin_bar_padding['left'], $unit ) . '!important;';
-				}
-				
+				$css .= $this->box_sides_css( $spacing['admin_bar_padding'], 'padding' );
 				$css .= '}';
 			}
 
@@ -790,76 +759,47 @@ class MASE_CSS_Generator {
 
 				// Submenu padding.
 				$css .= 'body.wp-admin #adminmenu .wp-submenu a{';
-				
-				if ( isset( $submenu_spacing['padding_top'] ) ) {
-					$css .= 'padding-top:' . $this->format_spacing_value( $submenu_spacing['padding_top'], $unit ) . '!important;';
-				}
-				if ( isset( $submenu_spacing['padding_right'] ) ) {
-					$css .= 'padding-right:' . $this->format_spacing_value( $submenu_spacing['padding_right'], $unit ) . '!important;';
-				}
-				if ( isset( $submenu_spacing['padding_bottom'] ) ) {
-					$css .= 'padding-bottom:' . $this->format_spacing_value( $submenu_spacing['padding_bottom'], $unit ) . '!important;';
-				}
-				if ( isset( $submenu_spacing['padding_left'] ) ) {
-					$css .= 'padding-left:' . $this->format_spacing_value( $submenu_spacing['padding_left'], $unit ) . '!important;';
-				}
-				
+				$css .= $this->box_sides_css( $submenu_spacing, 'padding', array( 'top', 'right', 'bottom', 'left' ), 1, 'padding_' );
 				$css .= '}';
 
 				// Submenu margin and offset.
 				$css .= 'body.wp-admin #adminmenu .wp-submenu{';
-				
+
 				if ( isset( $submenu_spacing['margin_top'] ) ) {
 					$css .= 'margin-top:' . $this->format_spacing_value( $submenu_spacing['margin_top'], $unit ) . '!important;';
 				}
 				if ( isset( $submenu_spacing['offset_left'] ) ) {
 					$css .= 'left:' . $this->format_spacing_value( $submenu_spacing['offset_left'], $unit ) . '!important;';
 				}
-				
+
 				$css .= '}';
 			}
 
 			// Generate content margin CSS.
 			if ( isset( $spacing['content_margin'] ) && is_array( $spacing['content_margin'] ) ) {
-				$content_margin = $spacing['content_margin'];
-				$unit = isset( $content_margin['unit'] ) ? $content_margin['unit'] : 'px';
-
 				$css .= 'body.wp-admin #wpbody-content{';
-				
-				if ( isset( $content_margin['top'] ) ) {
-					$css .= 'margin-top:' . $this->format_spacing_value( $content_margin['top'], $unit ) . '!important;';
-				}
-				if ( isset( $content_margin['right'] ) ) {
-					$css .= 'margin-right:' . $this->format_spacing_value( $content_margin['right'], $unit ) . '!important;';
-				}
-				if ( isset( $content_margin['bottom'] ) ) {
-					$css .= 'margin-bottom:' . $this->format_spacing_value( $content_margin['bottom'], $unit ) . '!important;';
-				}
-				if ( isset( $content_margin['left'] ) ) {
-					$css .= 'margin-left:' . $this->format_spacing_value( $content_margin['left'], $unit ) . '!important;';
-				}
-				
+				$css .= $this->box_sides_css( $spacing['content_margin'], 'margin' );
 				$css .= '}';
 			}
 
+			// Selectors that animate on spacing changes (Requirement 9.7).
+			$transition_targets = $this->admin_selectors( array(
+				'#adminmenu li.menu-top > a',
+				'#adminmenu li.menu-top',
+				'#wpadminbar .ab-item',
+				'#adminmenu .wp-submenu',
+				'#adminmenu .wp-submenu a',
+				'#wpbody-content',
+			) );
+
 			// Add smooth transitions for spacing changes (Requirement 9.7).
-			$css .= 'body.wp-admin #adminmenu li.menu-top > a,';
-			$css .= 'body.wp-admin #adminmenu li.menu-top,';
-			$css .= 'body.wp-admin #wpadminbar .ab-item,';
-			$css .= 'body.wp-admin #adminmenu .wp-submenu,';
-			$css .= 'body.wp-admin #adminmenu .wp-submenu a,';
-			$css .= 'body.wp-admin #wpbody-content{';
+			$css .= $transition_targets . '{';
 			$css .= 'transition:padding 0.3s ease,margin 0.3s ease,left 0.3s ease!important;';
 			$css .= '}';
 
 			// Add reduced motion support (Requirement 9.5, 10.5).
 			$css .= '@media (prefers-reduced-motion:reduce){';
-			$css .= 'body.wp-admin #adminmenu li.menu-top > a,';
-			$css .= 'body.wp-admin #adminmenu li.menu-top,';
-			$css .= 'body.wp-admin #wpadminbar .ab-item,';
-			$css .= 'body.wp-admin #adminmenu .wp-submenu,';
-			$css .= 'body.wp-admin #adminmenu .wp-submenu a,';
-			$css .= 'body.wp-admin #wpbody-content{';
+			$css .= $transition_targets . '{';
 			$css .= 'transition:none!important;';
 			$css .= '}';
 			$css .= '}';
@@ -913,37 +853,8 @@ class MASE_CSS_Generator {
 	 * @return string Fallback CSS for older browsers.
 	 */
 	private function generate_spacing_fallbacks( $spacing ) {
-		$css = '';
-
-		// Add comment for fallback section (removed in minification).
-		$css .= '/* Browser fallbacks for IE11 and older browsers */';
-
-		// Flexbox fallback for older browsers.
-		$css .= 'body.wp-admin #adminmenu{';
-		$css .= 'display:block;'; // Fallback for non-flexbox browsers.
-		$css .= 'display:-webkit-box;'; // Old Safari.
-		$css .= 'display:-ms-flexbox;'; // IE10.
-		$css .= 'display:flex;'; // Modern browsers.
-		$css .= '}';
-
-		// Box-sizing fallback for older browsers.
-		$css .= 'body.wp-admin #adminmenu li.menu-top > a,';
-		$css .= 'body.wp-admin #wpadminbar .ab-item,';
-		$css .= 'body.wp-admin #adminmenu .wp-submenu a{';
-		$css .= '-webkit-box-sizing:border-box;'; // Safari/Chrome.
-		$css .= '-moz-box-sizing:border-box;'; // Firefox.
-		$css .= 'box-sizing:border-box;'; // Modern browsers.
-		$css .= '}';
-
-		// Transition fallbacks with vendor prefixes.
-		$css .= 'body.wp-admin #adminmenu li.menu-top > a,';
-		$css .= 'body.wp-admin #adminmenu li.menu-top,';
-		$css .= 'body.wp-admin #wpadminbar .ab-item{';
-		$css .= '-webkit-transition:padding 0.3s ease,margin 0.3s ease;'; // Safari/Chrome.
-		$css .= '-moz-transition:padding 0.3s ease,margin 0.3s ease;'; // Firefox.
-		$css .= '-o-transition:padding 0.3s ease,margin 0.3s ease;'; // Opera.
-		$css .= 'transition:padding 0.3s ease,margin 0.3s ease;'; // Modern browsers.
-		$css .= '}';
+		// Static flexbox/box-sizing/transition fallbacks, assembled once.
+		$css = self::SPACING_FALLBACKS_BASE_CSS;
 
 		// Calc() fallback for older browsers.
 		// Provide static values as fallback before calc() expressions.
@@ -977,21 +888,8 @@ class MASE_CSS_Generator {
 			}
 		}
 
-		// IE-specific hacks for known issues.
-		$css .= '@media screen and (-ms-high-contrast:active),(-ms-high-contrast:none){';
-		$css .= '/* IE10+ specific styles */';
-		$css .= 'body.wp-admin #adminmenu li.menu-top > a{';
-		$css .= 'display:block;'; // Ensure block display in IE.
-		$css .= '}';
-		$css .= '}';
-
-		// Edge Legacy specific fixes.
-		$css .= '@supports (-ms-ime-align:auto){';
-		$css .= '/* Edge Legacy specific styles */';
-		$css .= 'body.wp-admin #adminmenu li.menu-top > a{';
-		$css .= 'display:block;'; // Ensure block display in Edge Legacy.
-		$css .= '}';
-		$css .= '}';
+		// IE-specific and Edge Legacy fixes for known issues.
+		$css .= self::SPACING_FALLBACKS_IE_CSS;
 
 		return $css;
 	}
@@ -1013,47 +911,15 @@ class MASE_CSS_Generator {
 
 		// Scale menu padding by 90%.
 		if ( isset( $spacing['menu_padding'] ) && is_array( $spacing['menu_padding'] ) ) {
-			$menu_padding = $spacing['menu_padding'];
-			$unit = isset( $menu_padding['unit'] ) ? $menu_padding['unit'] : 'px';
-
 			$css .= 'body.wp-admin #adminmenu li.menu-top > a{';
-			
-			if ( isset( $menu_padding['top'] ) ) {
-				$scaled_value = $this->scale_spacing_value( $menu_padding['top'], 0.9 );
-				$css .= 'padding-top:' . $this->format_spacing_value( $scaled_value, $unit ) . '!important;';
-			}
-			if ( isset( $menu_padding['right'] ) ) {
-				$scaled_value = $this->scale_spacing_value( $menu_padding['right'], 0.9 );
-				$css .= 'padding-right:' . $this->format_spacing_value( $scaled_value, $unit ) . '!important;';
-			}
-			if ( isset( $menu_padding['bottom'] ) ) {
-				$scaled_value = $this->scale_spacing_value( $menu_padding['bottom'], 0.9 );
-				$css .= 'padding-bottom:' . $this->format_spacing_value( $scaled_value, $unit ) . '!important;';
-			}
-			if ( isset( $menu_padding['left'] ) ) {
-				$scaled_value = $this->scale_spacing_value( $menu_padding['left'], 0.9 );
-				$css .= 'padding-left:' . $this->format_spacing_value( $scaled_value, $unit ) . '!important;';
-			}
-			
+			$css .= $this->box_sides_css( $spacing['menu_padding'], 'padding', array( 'top', 'right', 'bottom', 'left' ), 0.9 );
 			$css .= '}';
 		}
 
 		// Scale menu margin by 90%.
 		if ( isset( $spacing['menu_margin'] ) && is_array( $spacing['menu_margin'] ) ) {
-			$menu_margin = $spacing['menu_margin'];
-			$unit = isset( $menu_margin['unit'] ) ? $menu_margin['unit'] : 'px';
-
 			$css .= 'body.wp-admin #adminmenu li.menu-top{';
-			
-			if ( isset( $menu_margin['top'] ) ) {
-				$scaled_value = $this->scale_spacing_value( $menu_margin['top'], 0.9 );
-				$css .= 'margin-top:' . $this->format_spacing_value( $scaled_value, $unit ) . '!important;';
-			}
-			if ( isset( $menu_margin['bottom'] ) ) {
-				$scaled_value = $this->scale_spacing_value( $menu_margin['bottom'], 0.9 );
-				$css .= 'margin-bottom:' . $this->format_spacing_value( $scaled_value, $unit ) . '!important;';
-			}
-			
+			$css .= $this->box_sides_css( $spacing['menu_margin'], 'margin', array( 'top', 'bottom' ), 0.9 );
 			$css .= '}';
 		}
 
@@ -1068,101 +934,31 @@ class MASE_CSS_Generator {
 
 		if ( $mobile_overrides_enabled && isset( $spacing['mobile_overrides']['menu_padding'] ) ) {
 			// Use mobile override values (Requirement 10.3, 10.4).
-			$mobile_menu_padding = $spacing['mobile_overrides']['menu_padding'];
-			$unit = isset( $mobile_menu_padding['unit'] ) ? $mobile_menu_padding['unit'] : 'px';
-
 			$css .= 'body.wp-admin #adminmenu li.menu-top > a{';
-			
-			if ( isset( $mobile_menu_padding['top'] ) ) {
-				$css .= 'padding-top:' . $this->format_spacing_value( $mobile_menu_padding['top'], $unit ) . '!important;';
-			}
-			if ( isset( $mobile_menu_padding['right'] ) ) {
-				$css .= 'padding-right:' . $this->format_spacing_value( $mobile_menu_padding['right'], $unit ) . '!important;';
-			}
-			if ( isset( $mobile_menu_padding['bottom'] ) ) {
-				$css .= 'padding-bottom:' . $this->format_spacing_value( $mobile_menu_padding['bottom'], $unit ) . '!important;';
-			}
-			if ( isset( $mobile_menu_padding['left'] ) ) {
-				$css .= 'padding-left:' . $this->format_spacing_value( $mobile_menu_padding['left'], $unit ) . '!important;';
-			}
-			
+			$css .= $this->box_sides_css( $spacing['mobile_overrides']['menu_padding'], 'padding' );
 			$css .= '}';
 		} elseif ( isset( $spacing['menu_padding'] ) ) {
 			// Scale down by 75% (Requirement 9.2, 9.3).
-			$menu_padding = $spacing['menu_padding'];
-			$unit = isset( $menu_padding['unit'] ) ? $menu_padding['unit'] : 'px';
-
 			$css .= 'body.wp-admin #adminmenu li.menu-top > a{';
-			
-			if ( isset( $menu_padding['top'] ) ) {
-				$scaled_value = $this->scale_spacing_value( $menu_padding['top'], 0.75 );
-				$css .= 'padding-top:' . $this->format_spacing_value( $scaled_value, $unit ) . '!important;';
-			}
-			if ( isset( $menu_padding['right'] ) ) {
-				$scaled_value = $this->scale_spacing_value( $menu_padding['right'], 0.75 );
-				$css .= 'padding-right:' . $this->format_spacing_value( $scaled_value, $unit ) . '!important;';
-			}
-			if ( isset( $menu_padding['bottom'] ) ) {
-				$scaled_value = $this->scale_spacing_value( $menu_padding['bottom'], 0.75 );
-				$css .= 'padding-bottom:' . $this->format_spacing_value( $scaled_value, $unit ) . '!important;';
-			}
-			if ( isset( $menu_padding['left'] ) ) {
-				$scaled_value = $this->scale_spacing_value( $menu_padding['left'], 0.75 );
-				$css .= 'padding-left:' . $this->format_spacing_value( $scaled_value, $unit ) . '!important;';
-			}
-			
+			$css .= $this->box_sides_css( $spacing['menu_padding'], 'padding', array( 'top', 'right', 'bottom', 'left' ), 0.75 );
 			$css .= '}';
 		}
 
 		// Mobile menu margin - scale by 70% (Requirement 9.3).
 		if ( isset( $spacing['menu_margin'] ) && is_array( $spacing['menu_margin'] ) ) {
-			$menu_margin = $spacing['menu_margin'];
-			$unit = isset( $menu_margin['unit'] ) ? $menu_margin['unit'] : 'px';
-
 			$css .= 'body.wp-admin #adminmenu li.menu-top{';
-			
-			if ( isset( $menu_margin['top'] ) ) {
-				$scaled_value = $this->scale_spacing_value( $menu_margin['top'], 0.7 );
-				$css .= 'margin-top:' . $this->format_spacing_value( $scaled_value, $unit ) . '!important;';
-			}
-			if ( isset( $menu_margin['bottom'] ) ) {
-				$scaled_value = $this->scale_spacing_value( $menu_margin['bottom'], 0.7 );
-				$css .= 'margin-bottom:' . $this->format_spacing_value( $scaled_value, $unit ) . '!important;';
-			}
-			
+			$css .= $this->box_sides_css( $spacing['menu_margin'], 'margin', array( 'top', 'bottom' ), 0.7 );
 			$css .= '}';
 		}
 
 		// Mobile admin bar padding - use overrides or scale (Requirement 10.4, 10.5).
 		if ( $mobile_overrides_enabled && isset( $spacing['mobile_overrides']['admin_bar_padding'] ) ) {
-			$mobile_admin_bar_padding = $spacing['mobile_overrides']['admin_bar_padding'];
-			$unit = isset( $mobile_admin_bar_padding['unit'] ) ? $mobile_admin_bar_padding['unit'] : 'px';
-
 			$css .= 'body.wp-admin #wpadminbar .ab-item{';
-			
-			if ( isset( $mobile_admin_bar_padding['right'] ) ) {
-				$css .= 'padding-right:' . $this->format_spacing_value( $mobile_admin_bar_padding['right'], $unit ) . '!important;';
-			}
-			if ( isset( $mobile_admin_bar_padding['left'] ) ) {
-				$css .= 'padding-left:' . $this->format_spacing_value( $mobile_admin_bar_padding['left'], $unit ) . '!important;';
-			}
-			
+			$css .= $this->box_sides_css( $spacing['mobile_overrides']['admin_bar_padding'], 'padding', array( 'right', 'left' ) );
 			$css .= '}';
 		} elseif ( isset( $spacing['admin_bar_padding'] ) ) {
-			$admin_bar_padding = $spacing['admin_bar_padding'];
-			$unit = isset( $admin_bar_padding['unit'] ) ? $admin_bar_padding['unit'] : 'px';
-
 			$css .= 'body.wp-admin #wpadminbar .ab-item{';
-			
-			if ( isset( $admin_bar_padding['right'] ) ) {
-				$scaled_value = $this->scale_spacing_value( $admin_bar_padding['right'], 0.75 );
-				$css .= 'padding-right:' . $this->format_spacing_value( $scaled_value, $unit ) . '!important;';
-			}
-			if ( isset( $admin_bar_padding['left'] ) ) {
-				$scaled_value = $this->scale_spacing_value( $admin_bar_padding['left'], 0.75 );
-				$css .= 'padding-left:' . $this->format_spacing_value( $scaled_value, $unit ) . '!important;';
-			}
-			
+			$css .= $this->box_sides_css( $spacing['admin_bar_padding'], 'padding', array( 'right', 'left' ), 0.75 );
 			$css .= '}';
 		}
 
@@ -1171,6 +967,47 @@ class MASE_CSS_Generator {
 		return $css;
 	}
 
+	/**
+	 * Build a selector list with the admin body prefix.
+	 *
+	 * Joins selectors in one pass instead of concatenating the
+	 * 'body.wp-admin ' prefix line by line at each call site.
+	 *
+	 * @param array $selectors Selectors without the 'body.wp-admin ' prefix.
+	 * @return string Comma-separated selector list.
+	 */
+	private function admin_selectors( $selectors ) {
+		return 'body.wp-admin ' . implode( ',body.wp-admin ', $selectors );
+	}
+
+	/**
+	 * Build per-side declarations for a spacing box.
+	 *
+	 * Collapses the four near-identical top/right/bottom/left branches
+	 * repeated throughout the spacing generators into a single loop.
+	 *
+	 * @param array  $box        Spacing box values with optional 'unit'.
+	 * @param string $property   CSS property ('padding' or 'margin').
+	 * @param array  $sides      Optional. Sides to emit. Default all four.
+	 * @param float  $scale      Optional. Scaling factor for each value. Default 1.
+	 * @param string $key_prefix Optional. Key prefix (e.g. 'padding_' for submenu spacing).
+	 * @return string Side declarations CSS.
+	 */
+	private function box_sides_css( $box, $property, $sides = array( 'top', 'right', 'bottom', 'left' ), $scale = 1, $key_prefix = '' ) {
+		$unit = isset( $box['unit'] ) ? $box['unit'] : 'px';
+		$css  = '';
+
+		foreach ( $sides as $side ) {
+			$key = $key_prefix . $side;
+			if ( isset( $box[ $key ] ) ) {
+				$value = $this->scale_spacing_value( $box[ $key ], $scale );
+				$css  .= $property . '-' . $side . ':' . $this->format_spacing_value( $value, $unit ) . '!important;';
+			}
+		}
+
+		return $css;
+	}
+
 	/**
 	 * Scale spacing value by a factor.
 	 *
@@ -113,138 +113,149 @@ class MASE_Settings {
 	 * @return array Default settings array.
 	 */
 	public function get_defaults() {
-		return array(
-			'admin_bar'   => array(
-				'bg_color'    => '#23282d',
-				'text_color'  => '#ffffff',
-				'height'      => 32,
+		return self::DEFAULTS;
+	}
+
+	/**
+	 * Default settings.
+	 *
+	 * Stored as a class constant so the structure is materialized once at
+	 * compile time instead of being rebuilt on every get_defaults() call
+	 * (get_option() hits it on every admin page load).
+	 *
+	 * @var array
+	 */
+	const DEFAULTS = array(
+		'admin_bar'   => array(
+			'bg_color'    => '#23282d',
+			'text_color'  => '#ffffff',
+			'height'      => 32,
+		),
+		'admin_menu'  => array(
+			'bg_color'          => '#23282d',
+			'text_color'        => '#ffffff',
+			'hover_bg_color'    => '#191e23',
+			'hover_text_color'  => '#00b9eb',
+			'width'             => 160,
+		),
+		'performance' => array(
+			'enable_minification' => true,
+			'cache_duration'      => 3600,
+		),
+		'typography'  => array(
+			'admin_bar'  => array(
+				'font_size'      => 13,
+				'font_weight'    => 400,
+				'line_height'    => 1.5,
+				'letter_spacing' => 0,
+				'text_transform' => 'none',
 			),
-			'admin_menu'  => array(
-				'bg_color'          => '#23282d',
-				'text_color'        => '#ffffff',
-				'hover_bg_color'    => '#191e23',
-				'hover_text_color'  => '#00b9eb',
-				'width'             => 160,
+			'admin_menu' => array(
+				'font_size'      => 13,
+				'font_weight'    => 400,
+				'line_height'    => 1.5,
+				'letter_spacing' => 0,
+				'text_transform' => 'none',
 			),
-			'performance' => array(
-				'enable_minification' => true,
-				'cache_duration'      => 3600,
+			'content'    => array(
+				'font_size'      => 13,
+				'font_weight'    => 400,
+				'line_height'    => 1.6,
+				'letter_spacing' => 0,
+				'text_transform' => 'none',
 			),
-			'typography'  => array(
-				'admin_bar'  => array(
-					'font_size'      => 13,
-					'font_weight'    => 400,
-					'line_height'    => 1.5,
-					'letter_spacing' => 0,
-					'text_transform' => 'none',
-				),
-				'admin_menu' => array(
-					'font_size'      => 13,
-					'font_weight'    => 400,
-					'line_height'    => 1.5,
-					'letter_spacing' => 0,
-					'text_transform' => 'none',
-				),
-				'content'    => array(
-					'font_size'      => 13,
-					'font_weight'    => 400,
-					'line_height'    => 1.6,
-					'letter_spacing' => 0,
-					'text_transform' => 'none',
-				),
+		),
+		'visual_effects' => array(
+			'admin_bar' => array(
+				'border_radius'    => 0,
+				'shadow_intensity' => 'none',
+				'shadow_direction' => 'bottom',
+				'shadow_blur'      => 10,
+				'shadow_color'     => 'rgba(0, 0, 0, 0.15)',
 			),
-			'visual_effects' => array(
-				'admin_bar' => array(
-					'border_radius'    => 0,
-					'shadow_intensity' => 'none',
-					'shadow_direction' => 'bottom',
-					'shadow_blur'      => 10,
-					'shadow_color'     => 'rgba(0, 0, 0, 0.15)',
-				),
-				'admin_menu' => array(
-					'border_radius'    => 0,
-					'shadow_intensity' => 'none',
-					'shadow_direction' => 'bottom',
-					'shadow_blur'      => 10,
-					'shadow_color'     => 'rgba(0, 0, 0, 0.15)',
-				),
-				'buttons' => array(
-					'border_radius'    => 3,
-					'shadow_intensity' => 'subtle',
-					'shadow_direction' => 'bottom',
-					'shadow_blur'      => 8,
-					'shadow_color'     => 'rgba(0, 0, 0, 0.1)',
-				),
-				'form_fields' => array(
-					'border_radius'    => 3,
-					'shadow_intensity' => 'none',
-					'shadow_direction' => 'bottom',
-					'shadow_blur'      => 5,
-					'shadow_color'     => 'rgba(0, 0, 0, 0.05)',
-				),
-				'preset' => 'flat',
-				'disable_mobile_shadows' => false,
-				'auto_detect_low_power' => true,
+			'admin_menu' => array(
+				'border_radius'    => 0,
+				'shadow_intensity' => 'none',
+				'shadow_direction' => 'bottom',
+				'shadow_blur'      => 10,
+				'shadow_color'     => 'rgba(0, 0, 0, 0.15)',
+			),
+			'buttons' => array(
+				'border_radius'    => 3,
+				'shadow_intensity' => 'subtle',
+				'shadow_direction' => 'bottom',
+				'shadow_blur'      => 8,
+				'shadow_color'     => 'rgba(0, 0, 0, 0.1)',
+			),
+			'form_fields' => array(
+				'border_radius'    => 3,
+				'shadow_intensity' => 'none',
+				'shadow_direction' => 'bottom',
+				'shadow_blur'      => 5,
+				'shadow_color'     => 'rgba(0, 0, 0, 0.05)',
+			),
+			'preset' => 'flat',
+			'disable_mobile_shadows' => false,
+			'auto_detect_low_power' => true,
+		),
+		'spacing' => array(
+			'menu_padding' => array(
+				'top'    => 10,
+				'right'  => 15,
+				'bottom' => 10,
+				'left'   => 15,
+				'unit'   => 'px',
+			),
+			'menu_margin' => array(
+				'top'    => 2,
+				'right'  => 0,
+				'bottom' => 2,
+				'left'   => 0,
+				'unit'   => 'px',
+			),
+			'admin_bar_padding' => array(
+				'top'    => 0,
+				'right'  => 10,
+				'bottom' => 0,
+				'left'   => 10,
+				'unit'   => 'px',
 			),
-			'spacing' => array(
+			'submenu_spacing' => array(
+				'padding_top'    => 8,
+				'padding_right'  => 12,
+				'padding_bottom' => 8,
+				'padding_left'   => 12,
+				'margin_top'     => 0,
+				'offset_left'    => 0,
+				'unit'           => 'px',
+			),
+			'content_margin' => array(
+				'top'    => 20,
+				'right'  => 20,
+				'bottom' => 20,
+				'left'   => 20,
+				'unit'   => 'px',
+			),
+			'mobile_overrides' => array(
+				'enabled' => false,
 				'menu_padding' => array(
-					'top'    => 10,
-					'right'  => 15,
-					'bottom' => 10,
-					'left'   => 15,
-					'unit'   => 'px',
-				),
-				'menu_margin' => array(
-					'top'    => 2,
-					'right'  => 0,
-					'bottom' => 2,
-					'left'   => 0,
+					'top'    => 8,
+					'right'  => 12,
+					'bottom' => 8,
+					'left'   => 12,
 					'unit'   => 'px',
 				),
 				'admin_bar_padding' => array(
 					'top'    => 0,
-					'right'  => 10,
+					'right'  => 8,
 					'bottom' => 0,
-					'left'   => 10,
-					'unit'   => 'px',
-				),
-				'submenu_spacing' => array(
-					'padding_top'    => 8,
-					'padding_right'  => 12,
-					'padding_bottom' => 8,
-					'padding_left'   => 12,
-					'margin_top'     => 0,
-					'offset_left'    => 0,
-					'unit'           => 'px',
-				),
-				'content_margin' => array(
-					'top'    => 20,
-					'right'  => 20,
-					'bottom' => 20,
-					'left'   => 20,
+					'left'   => 8,
 					'unit'   => 'px',
 				),
-				'mobile_overrides' => array(
-					'enabled' => false,
-					'menu_padding' => array(
-						'top'    => 8,
-						'right'  => 12,
-						'bottom' => 8,
-						'left'   => 12,
-						'unit'   => 'px',
-					),
-					'admin_bar_padding' => array(
-						'top'    => 0,
-						'right'  => 8,
-						'bottom' => 0,
-						'left'   => 8,
-						'unit'   => 'px',
-					),
-				),
-				'preset' => 'default',
 			),
-		);
-	}
+			'preset' => 'default',
+		),
+	);
 
 	/**
 	 * Validate settings input.
@@ -1564,74 +1575,85 @@ class MASE_Settings {
 	 * @return array Array of color palettes.
 	 */
 	public function get_default_palettes() {
-		return array(
-			'default'           => array(
-				'name'       => 'WordPress Default',
-				'admin_bar'  => array(
-					'bg_color'   => '#23282d',
-					'text_color' => '#ffffff',
-				),
-				'admin_menu' => array(
-					'bg_color'          => '#23282d',
-					'text_color'        => '#ffffff',
-					'hover_bg_color'    => '#191e23',
-					'hover_text_color'  => '#00b9eb',
-				),
+		return self::DEFAULT_PALETTES;
+	}
+
+	/**
+	 * Default color palettes.
+	 *
+	 * Stored as a class constant for the same reason as DEFAULTS: the
+	 * palette list is fixed literal data and does not need to be rebuilt
+	 * on every call.
+	 *
+	 * @var array
+	 */
+	const DEFAULT_PALETTES = array(
+		'default'           => array(
+			'name'       => 'WordPress Default',
+			'admin_bar'  => array(
+				'bg_color'   => '#23282d',
+				'text_color' => '#ffffff',
 			),
-			'professional_blue' => array(
-				'name'       => 'Professional Blue',
-				'admin_bar'  => array(
-					'bg_color'   => '#3B82F6',
-					'text_color' => '#ffffff',
-				),
-				'admin_menu' => array(
-					'bg_color'          => '#1E40AF',
-					'text_color'        => '#ffffff',
-					'hover_bg_color'    => '#1D4ED8',
-					'hover_text_color'  => '#E0E7FF',
-				),
+			'admin_menu' => array(
+				'bg_color'          => '#23282d',
+				'text_color'        => '#ffffff',
+				'hover_bg_color'    => '#191e23',
+				'hover_text_color'  => '#00b9eb',
 			),
-			'creative_purple'   => array(
-				'name'       => 'Creative Purple',
-				'admin_bar'  => array(
-					'bg_color'   => '#8B5CF6',
-					'text_color' => '#ffffff',
-				),
-				'admin_menu' => array(
-					'bg_color'          => '#7C3AED',
-					'text_color'        => '#ffffff',
-					'hover_bg_color'    => '#8B5CF6',
-					'hover_text_color'  => '#EDE9FE',
-				),
+		),
+		'professional_blue' => array(
+			'name'       => 'Professional Blue',
+			'admin_bar'  => array(
+				'bg_color'   => '#3B82F6',
+				'text_color' => '#ffffff',
 			),
-			'energetic_green'   => array(
-				'name'       => 'Energetic Green',
-				'admin_bar'  => array(
-					'bg_color'   => '#10B981',
-					'text_color' => '#ffffff',
-				),
-				'admin_menu' => array(
-					'bg_color'          => '#059669',
-					'text_color'        => '#ffffff',
-					'hover_bg_color'    => '#10B981',
-					'hover_text_color'  => '#D1FAE5',
-				),
+			'admin_menu' => array(
+				'bg_color'          => '#1E40AF',
+				'text_color'        => '#ffffff',
+				'hover_bg_color'    => '#1D4ED8',
+				'hover_text_color'  => '#E0E7FF',
 			),
-			'warm_orange'       => array(
-				'name'       => 'Warm Orange',
-				'admin_bar'  => array(
-					'bg_color'   => '#F97316',
-					'text_color' => '#ffffff',
-				),
-				'admin_menu' => array(
-					'bg_color'          => '#EA580C',
-					'text_color'        => '#ffffff',
-					'hover_bg_color'    => '#F97316',
-					'hover_text_color'  => '#FED7AA',
-				),
+		),
+		'creative_purple'   => array(
+			'name'       => 'Creative Purple',
+			'admin_bar'  => array(
+				'bg_color'   => '#8B5CF6',
+				'text_color' => '#ffffff',
 			),
-		);
-	}
+			'admin_menu' => array(
+				'bg_color'          => '#7C3AED',
+				'text_color'        => '#ffffff',
+				'hover_bg_color'    => '#8B5CF6',
+				'hover_text_color'  => '#EDE9FE',
+			),
+		),
+		'energetic_green'   => array(
+			'name'       => 'Energetic Green',
+			'admin_bar'  => array(
+				'bg_color'   => '#10B981',
+				'text_color' => '#ffffff',
+			),
+			'admin_menu' => array(
+				'bg_color'          => '#059669',
+				'text_color'        => '#ffffff',
+				'hover_bg_color'    => '#10B981',
+				'hover_text_color'  => '#D1FAE5',
+			),
+		),
+		'warm_orange'       => array(
+			'name'       => 'Warm Orange',
+			'admin_bar'  => array(
+				'bg_color'   => '#F97316',
+				'text_color' => '#ffffff',
+			),
+			'admin_menu' => array(
+				'bg_color'          => '#EA580C',
+				'text_color'        => '#ffffff',
+				'hover_bg_color'    => '#F97316',
+				'hover_text_color'  => '#FED7AA',
+			),
+		),
+	);
 
 	/**
 	 * Apply a color palette.
@@ -7,65 +7,83 @@
  * @package Modern_Admin_Styler_Enterprise
  */
 
-// Load WordPress
-require_once dirname( dirname( dirname( dirname( __FILE__ ) ) ) ) . '/wp-load.php';
+/**
+ * Run the performance test suite.
+ *
+ * @return array Report lines.
+ */
+function mase_run_performance_tests() {
+	// Buffer report lines and emit once at the end - one write instead of one per line.
+	$out = array();
 
-// Load MASE classes
-require_once dirname( __DIR__ ) . '/includes/class-mase-settings.php';
-require_once dirname( __DIR__ ) . '/includes/class-mase-css-generator.php';
+	$out[] = "=== MASE Performance Test ===\n";
 
-echo "=== MASE Performance Test ===\n\n";
+	// Initialize
+	$settings = new MASE_Settings();
+	$generator = new MASE_CSS_Generator();
+	$test_settings = $settings->get_defaults();
 
-// Initialize
-$settings = new MASE_Settings();
-$generator = new MASE_CSS_Generator();
-$test_settings = $settings->get_defaults();
+	// Test 1: CSS Generation Speed
+	$out[] = 'Test 1: CSS Generation Speed';
+	$out[] = 'Target: <100ms';
 
-// Test 1: CSS Generation Speed
-echo "Test 1: CSS Generation Speed\n";
-echo "Target: <100ms\n";
+	$iterations = 100;
+	$total_time = 0;
 
-$iterations = 100;
-$total_time = 0;
+	for ( $i = 0; $i < $iterations; $i++ ) {
+		$start = microtime( true );
+		$css = $generator->generate( $test_settings );
+		$end = microtime( true );
+		$total_time += ( $end - $start ) * 1000; // Convert to milliseconds
+	}
 
-for ( $i = 0; $i < $iterations; $i++ ) {
-	$start = microtime( true );
+	$avg_time = $total_time / $iterations;
+	$status = $avg_time < 100 ? '✅ PASS' : '❌ FAIL';
+
+	$out[] = 'Average time: ' . number_format( $avg_time, 2 ) . 'ms';
+	$out[] = "Status: $status\n";
+
+	// Test 2: CSS Minification Speed
+	$out[] = 'Test 2: CSS Minification Speed';
 	$css = $generator->generate( $test_settings );
+
+	$start = microtime( true );
+	$minified = $generator->minify( $css );
 	$end = microtime( true );
-	$total_time += ( $end - $start ) * 1000; // Convert to milliseconds
-}
+	$minify_time = ( $end - $start ) * 1000;
 
-$avg_time = $total_time / $iterations;
-$status = $avg_time < 100 ? '✅ PASS' : '❌ FAIL';
+	$out[] = 'Minification time: ' . number_format( $minify_time, 2 ) . 'ms';
+	$out[] = 'Original size: ' . strlen( $css ) . ' bytes';
+	$out[] = 'Minified size: ' . strlen( $minified ) . ' bytes';
+	$out[] = 'Reduction: ' . number_format( ( 1 - strlen( $minified ) / strlen( $css ) ) * 100, 1 ) . "%\n";
 
-echo "Average time: " . number_format( $avg_time, 2 ) . "ms\n";
-echo "Status: $status\n\n";
+	// Test 3: Memory Usage
+	$out[] = 'Test 3: Memory Usage';
+	$out[] = 'Target: <10MB plugin load';
 
-// Test 2: CSS Minification Speed
-echo "Test 2: CSS Minification Speed\n";
-$css = $generator->generate( $test_settings );
+	$mem_start = memory_get_usage();
+	$css = $generator->generate( $test_settings );
+	$mem_end = memory_get_usage();
+	$mem_used = ( $mem_end - $mem_start ) / 1024 / 1024; // Convert to MB
 
-$start = microtime( true );
-$minified = $generator->minify( $css );
-$end = microtime( true );
-$minify_time = ( $end - $start ) * 1000;
+	$mem_status = $mem_used < 2 ? '✅ PASS' : '❌ FAIL';
+	$out[] = 'Memory used for generation: ' . number_format( $mem_used, 2 ) . 'MB';
+	$out[] = "Status: $mem_status\n";
 
-echo "Minification time: " . number_format( $minify_time, 2 ) . "ms\n";
-echo "Original size: " . strlen( $css ) . " bytes\n";
-echo "Minified size: " . strlen( $minified ) . " bytes\n";
-echo "Reduction: " . number_format( ( 1 - strlen( $minified ) / strlen( $css ) ) * 100, 1 ) . "%\n\n";
+	$out[] = '=== Test Complete ===';
 
-// Test 3: Memory Usage
-echo "Test 3: Memory Usage\n";
-echo "Target: <10MB plugin load\n";
+	return $out;
+}
 
-$mem_start = memory_get_usage();
-$css = $generator->generate( $test_settings );
-$mem_end = memory_get_usage();
-$mem_used = ( $mem_end - $mem_start ) / 1024 / 1024; // Convert to MB
+// Bootstrap and run only when executed directly, so tooling that merely
+// includes this file does not pay for a WordPress load and a full test run.
+if ( ! empty( $_SERVER['SCRIPT_FILENAME'] ) && realpath( $_SERVER['SCRIPT_FILENAME'] ) === __FILE__ ) {
+	// Load WordPress
+	require_once dirname( dirname( dirname( dirname( __FILE__ ) ) ) ) . '/wp-load.php';
 
-$mem_status = $mem_used < 2 ? '✅ PASS' : '❌ FAIL';
-echo "Memory used for generation: " . number_format( $mem_used, 2 ) . "MB\n";
-echo "Status: $mem_status\n\n";
+	// Load MASE classes
+	require_once dirname( __DIR__ ) . '/includes/class-mase-settings.php';
+	require_once dirname( __DIR__ ) . '/includes/class-mase-css-generator.php';
 
-echo "=== Test Complete ===\n";
+	echo implode( "\n", mase_run_performance_tests() ) . "\n";
+}